@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 """
 Add PDF download links to certification pages.
+
+Links are generated from the PDF manifest (see pdf_manifest.py) so every
+page points at its own cert-namespaced PDF.
 """
 import os
 import re
 from pathlib import Path
 
+from pdf_manifest import load_manifest, pdf_url_for
+
+PDF_LINK_PATTERN = re.compile(r'(<div class="pdf-download">\s*<a href=")([^"]*)(")')
+
 def add_download_links():
     """Add PDF download links to certification pages."""
+    manifest = load_manifest()
+    
     # Define certification directories
     cert_dirs = [
         'kcna', 'cka', 'ckad', 'cks', 'kcsa',  # Kubestronaut certs
@@ -22,20 +31,30 @@ def add_download_links():
             for file in files:
                 if file.endswith('.md') and file != 'README.md':
                     file_path = os.path.join(root, file)
-                    pdf_name = os.path.splitext(file)[0] + '.pdf'
+                    pdf_url = pdf_url_for(manifest, file_path)
+                    
+                    # Skip pages that have no PDF in the manifest
+                    if pdf_url is None:
+                        continue
                     
                     # Read the file content
                     with open(file_path, 'r', encoding='utf-8') as f:
                         content = f.read()
                     
-                    # Skip if download link already exists
-                    if '![](' in content and 'Download PDF' in content:
+                    # Point an existing download link at the manifest entry
+                    match = PDF_LINK_PATTERN.search(content)
+                    if match:
+                        if match.group(2) != pdf_url:
+                            content = PDF_LINK_PATTERN.sub(rf'\g<1>{pdf_url}\g<3>', content, count=1)
+                            with open(file_path, 'w', encoding='utf-8') as f:
+                                f.write(content)
+                            print(f"Updated download link in {file_path}")
                         continue
                     
                     # Create the download link
                     download_section = f"""
 <div class="pdf-download">
-  <a href="/pdf/{pdf_name}" class="md-button md-button--primary" download>
+  <a href="{pdf_url}" class="md-button md-button--primary" download>
     <span class="twemoji">
       <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><path d="M5 20h14v-2H5v2zM19 9h-4V3H9v6H5l7 7 7-7z"></path></svg>
     </span>
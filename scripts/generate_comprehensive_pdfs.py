@@ -8,11 +8,37 @@ combining all chapters into a single PDF with table of contents.
 import os
 import re
 import yaml
+import json
+import time
+import queue
+import socket
+import argparse
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import subprocess
 import sys
 
+PANDOC_SERVER_BASE_PORT = 3030
+PANDOC_SERVER_TIMEOUT = 300
+PANDOC_SERVER_PORT_ATTEMPTS = 50
+
+# pandoc-server only listens locally, so never route its requests via a proxy
+LOCAL_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+# Template variables shared by the per-process and pandoc-server backends
+PANDOC_VARIABLES = {
+    'geometry': 'margin=1.5cm',
+    'fontsize': '11pt',
+    'documentclass': 'article',
+    'colorlinks': 'true',
+    'linkcolor': 'blue',
+    'urlcolor': 'blue',
+    'toccolor': 'blue'
+}
+
 def load_mkdocs_config():
     """Load the mkdocs.yml configuration."""
     with open('mkdocs.yml', 'r') as f:
@@ -123,15 +149,10 @@ def convert_markdown_to_pdf_pandoc(markdown_file, output_file):
             '--pdf-engine=weasyprint',
             '--toc',
             '--toc-depth=3',
-            '--number-sections',
-            '-V', 'geometry:margin=1.5cm',
-            '-V', 'fontsize=11pt',
-            '-V', 'documentclass=article',
-            '-V', 'colorlinks=true',
-            '-V', 'linkcolor=blue',
-            '-V', 'urlcolor=blue',
-            '-V', 'toccolor=blue'
+            '--number-sections'
         ]
+        for name, value in PANDOC_VARIABLES.items():
+            cmd.extend(['-V', f"{name}={value}"])
         
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
         
@@ -151,6 +172,132 @@ def convert_markdown_to_pdf_pandoc(markdown_file, output_file):
         print(f"  Pandoc conversion error: {e}")
         return False
 
+def start_pandoc_servers(count, base_port=PANDOC_SERVER_BASE_PORT):
+    """Start a bounded pool of local pandoc-server processes.
+
+    Returns a list of (process, url) tuples for the servers that came up.
+    """
+    servers = []
+    for port in range(base_port, base_port + PANDOC_SERVER_PORT_ATTEMPTS):
+        if len(servers) == count:
+            break
+        if not is_port_free(port):
+            continue
+
+        cmd = [
+            'pandoc', 'server',
+            '--port', str(port),
+            '--timeout', str(PANDOC_SERVER_TIMEOUT)
+        ]
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            print("  Pandoc not found, cannot start pandoc-server")
+            break
+
+        url = f"http://127.0.0.1:{port}"
+        # Re-check the process so a reply from another listener is not trusted
+        if wait_for_pandoc_server(url, process) and process.poll() is None:
+            servers.append((process, url))
+        else:
+            # The port was free, so pandoc itself cannot serve; stop trying
+            print(f"  pandoc-server on port {port} did not start")
+            process.terminate()
+            break
+
+    return servers
+
+def is_port_free(port):
+    """Check whether a local TCP port can be bound."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind(('127.0.0.1', port))
+        except OSError:
+            return False
+    return True
+
+def wait_for_pandoc_server(url, process, timeout=10):
+    """Poll the pandoc-server version endpoint until it responds."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with LOCAL_OPENER.open(f"{url}/version", timeout=1):
+                return True
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.1)
+    return False
+
+def stop_pandoc_servers(servers):
+    """Terminate all pandoc-server processes in the pool."""
+    for process, _ in servers:
+        process.terminate()
+    for process, _ in servers:
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+def render_html_pandoc_server(markdown_file, server_url):
+    """Render markdown to standalone HTML using a running pandoc-server instance.
+
+    pandoc-server cannot run a PDF engine itself, so the returned HTML is
+    written to PDF separately with write_pdf_from_html(). Returns None on error.
+    """
+    try:
+        with open(markdown_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        payload = {
+            'text': content,
+            'from': 'markdown',
+            'to': 'html5',
+            'standalone': True,
+            'table-of-contents': True,
+            'toc-depth': 3,
+            'number-sections': True,
+            'variables': dict(PANDOC_VARIABLES, pagetitle=Path(markdown_file).stem)
+        }
+        request = urllib.request.Request(
+            server_url,
+            data=json.dumps(payload).encode('utf-8'),
+            headers={'Content-Type': 'application/json', 'Accept': 'application/json'}
+        )
+        with LOCAL_OPENER.open(request, timeout=PANDOC_SERVER_TIMEOUT) as response:
+            result = json.loads(response.read().decode('utf-8'))
+
+        for message in result.get('messages', []):
+            if message.get('verbosity') in ('WARNING', 'ERROR'):
+                # Log messages carry type-specific fields, so print them all
+                details = {k: v for k, v in message.items() if k not in ('verbosity', 'type')}
+                print(f"  pandoc-server {message.get('verbosity')} {message.get('type')}: {details}")
+
+        if 'output' not in result:
+            print(f"  pandoc-server error: {result.get('error', result)}")
+            return None
+
+        return result['output']
+
+    except urllib.error.HTTPError as e:
+        print(f"  pandoc-server error: {e.read().decode('utf-8', 'replace')}")
+        return None
+    except Exception as e:
+        print(f"  pandoc-server conversion error: {e}")
+        return None
+
+def write_pdf_from_html(html, markdown_file, output_file):
+    """Write pandoc-server HTML to PDF with WeasyPrint."""
+    try:
+        from weasyprint import HTML
+
+        HTML(string=html, base_url=os.path.dirname(markdown_file)).write_pdf(output_file)
+        return True
+
+    except Exception as e:
+        print(f"  WeasyPrint error: {e}")
+        return False
+
 def convert_markdown_to_pdf_weasyprint(markdown_file, output_file):
     """Convert markdown to PDF using WeasyPrint directly."""
     try:
@@ -267,8 +414,45 @@ def convert_markdown_to_pdf_weasyprint(markdown_file, output_file):
         print(f"  WeasyPrint error: {e}")
         return False
 
+def run_pandoc(combined_md, pdf_file, server_pool=None):
+    """Run the pandoc step for one guide, returning (result, seconds).
+
+    In process mode the result is whether pandoc wrote the PDF; in server
+    mode it is the rendered HTML (or None). Both are safe to run on worker
+    threads because WeasyPrint is never called in-process here.
+    """
+    if server_pool is None:
+        start = time.perf_counter()
+        return convert_markdown_to_pdf_pandoc(combined_md, pdf_file), time.perf_counter() - start
+
+    server_url = server_pool.get()
+    try:
+        start = time.perf_counter()
+        html = render_html_pandoc_server(combined_md, server_url)
+        return html, time.perf_counter() - start
+    finally:
+        server_pool.put(server_url)
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate comprehensive certification PDFs.")
+    parser.add_argument(
+        '--pandoc-mode',
+        choices=['process', 'server'],
+        default='process',
+        help="'process' spawns pandoc per guide, 'server' batches guides through a pandoc-server pool"
+    )
+    parser.add_argument(
+        '--pandoc-workers',
+        type=int,
+        default=1,
+        help="number of concurrent pandoc jobs (default 1, the serial baseline); also sizes the pandoc-server pool in server mode"
+    )
+    return parser.parse_args()
+
 def main():
     """Main function to generate comprehensive PDFs."""
+    args = parse_args()
     print("Starting comprehensive PDF generation...")
     
     # Create output directories
@@ -288,42 +472,80 @@ def main():
     
     print(f"Found {len(all_certifications)} certifications")
     
-    # Generate PDF for each certification
-    success_count = 0
+    # Generate combined markdown for each certification
+    jobs = []
     for cert_name, pages in all_certifications.items():
-        print(f"\nGenerating PDF for {cert_name}...")
-        
-        # Generate combined markdown
         combined_md = generate_combined_markdown(cert_name, pages, temp_dir)
         print(f"  Created combined markdown: {combined_md}")
         
         # Generate output filename
         safe_cert_name = cert_name.replace(' ', '_').replace('/', '_').replace('(', '').replace(')', '')
         pdf_file = os.path.join(pdf_dir, f"{safe_cert_name}_Study_Guide.pdf")
-        
-        # Try to convert to PDF using different methods
-        success = False
-        
-        # Method 1: Try pandoc first (usually produces better results)
-        print("  Trying pandoc conversion...")
-        success = convert_markdown_to_pdf_pandoc(combined_md, pdf_file)
-        
-        # Method 2: Fall back to WeasyPrint
-        if not success:
-            print("  Trying WeasyPrint conversion...")
-            success = convert_markdown_to_pdf_weasyprint(combined_md, pdf_file)
-        
-        if success:
-            print(f"  ✓ Successfully generated: {pdf_file}")
-            success_count += 1
+        jobs.append((cert_name, combined_md, pdf_file))
+    
+    # Start the pandoc-server pool when batching
+    workers = max(1, min(args.pandoc_workers, len(jobs)))
+    servers = []
+    server_pool = None
+    if args.pandoc_mode == 'server':
+        print(f"\nStarting {workers} pandoc-server process(es)...")
+        servers = start_pandoc_servers(workers)
+        if servers:
+            workers = len(servers)
+            server_pool = queue.Queue()
+            for _, url in servers:
+                server_pool.put(url)
         else:
-            print(f"  ✗ Failed to generate PDF for {cert_name}")
+            print("  No pandoc-server available, falling back to per-process pandoc")
+    
+    # Generate PDF for each certification
+    print(f"\nGenerating PDFs ({'pandoc-server' if server_pool else 'pandoc per process'}, {workers} worker(s))...")
+    build_start = time.perf_counter()
+    timings = []
+    try:
+        # Only the pandoc step runs on worker threads; WeasyPrint is not
+        # thread-safe, so every in-process render happens on this thread.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (cert_name, combined_md, pdf_file, executor.submit(run_pandoc, combined_md, pdf_file, server_pool))
+                for cert_name, combined_md, pdf_file in jobs
+            ]
+            for cert_name, combined_md, pdf_file, future in futures:
+                result, elapsed = future.result()
+                
+                start = time.perf_counter()
+                if server_pool is not None:
+                    success = result is not None and write_pdf_from_html(result, combined_md, pdf_file)
+                else:
+                    success = result
+                
+                # Fall back to WeasyPrint
+                if not success:
+                    print(f"  Trying WeasyPrint conversion for {cert_name}...")
+                    success = convert_markdown_to_pdf_weasyprint(combined_md, pdf_file)
+                elapsed += time.perf_counter() - start
+                
+                timings.append((cert_name, success, elapsed))
+                if success:
+                    print(f"  ✓ Successfully generated: {pdf_file} ({elapsed:.2f}s)")
+                else:
+                    print(f"  ✗ Failed to generate PDF for {cert_name} ({elapsed:.2f}s)")
+    finally:
+        stop_pandoc_servers(servers)
+    build_elapsed = time.perf_counter() - build_start
+    success_count = sum(1 for _, success, _ in timings if success)
     
     # Cleanup temporary files
     import shutil
     if os.path.exists(temp_dir):
         shutil.rmtree(temp_dir)
     
+    # Report per-document timings for comparing pandoc modes
+    print("\nPer-document timings:")
+    for cert_name, success, elapsed in timings:
+        print(f"  {cert_name:<50} {elapsed:8.2f}s  {'ok' if success else 'failed'}")
+    print(f"  {f'Total (wall clock, {workers} worker(s))':<50} {build_elapsed:8.2f}s")
+    
     print(f"\nPDF generation complete!")
     print(f"Successfully generated: {success_count}/{len(all_certifications)} PDFs")
     print(f"PDFs available in: {pdf_dir}")
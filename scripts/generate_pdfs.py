@@ -6,49 +6,12 @@ This script generates PDF versions of all study guides using WeasyPrint.
 """
 import os
 import re
-import yaml
 from pathlib import Path
 from weasyprint import HTML
 from markdown import markdown
 from bs4 import BeautifulSoup
 
-def load_mkdocs_config():
-    """Load the mkdocs.yml configuration."""
-    with open('mkdocs.yml', 'r') as f:
-        return yaml.safe_load(f)
-
-def get_certification_pages():
-    """Extract certification pages from mkdocs.yml."""
-    config = load_mkdocs_config()
-    cert_pages = []
-    
-    # Define the sections that contain certification content
-    cert_sections = [
-        'Kubestronaut (5 Certs)',
-        'Golden Kubestronaut (Additional Certs)'
-    ]
-    
-    for section in config['nav']:
-        if isinstance(section, dict) and section.get('Kubestronaut (5 Certs)'):
-            cert_pages.extend(process_section(section['Kubestronaut (5 Certs)']))
-        elif isinstance(section, dict) and section.get('Golden Kubestronaut (Additional Certs)'):
-            cert_pages.extend(process_section(section['Golden Kubestronaut (Additional Certs)']))
-    
-    return cert_pages
-
-def process_section(section):
-    """Process a section of the navigation and extract pages."""
-    pages = []
-    for item in section:
-        if isinstance(item, dict):
-            for title, content in item.items():
-                if isinstance(content, list):
-                    for subitem in content:
-                        if isinstance(subitem, str):
-                            pages.append((title, subitem))
-                        elif isinstance(subitem, dict):
-                            pages.extend([(f"{title} - {k}", v) for k, v in subitem.items()])
-    return pages
+from pdf_manifest import PDF_DIR, build_manifest, get_certification_pages, write_manifest
 
 def generate_pdf(input_path, output_path, title):
     """Generate a PDF from a markdown file."""
@@ -152,24 +115,29 @@ def generate_pdf(input_path, output_path, title):
 def main():
     """Main function to generate PDFs for all certification pages."""
     # Create output directory if it doesn't exist
-    os.makedirs('site/pdf', exist_ok=True)
+    os.makedirs(PDF_DIR, exist_ok=True)
     
     # Get all certification pages
     cert_pages = get_certification_pages()
     
+    # Map each source to a cert-namespaced output before rendering anything
+    manifest, titles, skipped = build_manifest(cert_pages)
+    for title, source, reason in skipped:
+        print(f"Skipping {title} ({source}): {reason}")
+    write_manifest(manifest)
+    
     # Generate PDF for each page
-    for title, path in cert_pages:
-        if path.endswith('.md'):
-            input_path = path
-            output_filename = os.path.splitext(os.path.basename(path))[0] + '.pdf'
-            output_path = os.path.join('site', 'pdf', output_filename)
-            
-            print(f"Generating PDF for {title}...")
-            try:
-                generate_pdf(input_path, output_path, title)
-                print(f"  -> Saved to {output_path}")
-            except Exception as e:
-                print(f"  Error generating PDF for {title}: {str(e)}")
+    for source, pdf_name in manifest.items():
+        title = titles[source]
+        output_path = os.path.join(PDF_DIR, *pdf_name.split('/'))
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        
+        print(f"Generating PDF for {title}...")
+        try:
+            generate_pdf(source, output_path, title)
+            print(f"  -> Saved to {output_path}")
+        except Exception as e:
+            print(f"  Error generating PDF for {title}: {str(e)}")
 
 if __name__ == "__main__":
     main()
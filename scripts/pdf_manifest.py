@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+PDF Manifest Helpers for Golden Kubestronaut Learning
+
+Maps each certification page in mkdocs.yml to a cert-namespaced PDF under
+site/pdf (e.g. cka/sample-questions.md -> cka/sample-questions.pdf) and
+records the mapping in site/pdf/manifest.json so link injectors can use it.
+"""
+import os
+import json
+import yaml
+from pathlib import PurePosixPath
+
+PDF_DIR = os.path.join('site', 'pdf')
+MANIFEST_PATH = os.path.join(PDF_DIR, 'manifest.json')
+PDF_URL_PREFIX = '/pdf/'
+
+CERT_SECTIONS = [
+    'Kubestronaut (5 Certs)',
+    'Golden Kubestronaut (Additional Certs)'
+]
+
+def load_mkdocs_config():
+    """Load the mkdocs.yml configuration."""
+    with open('mkdocs.yml', 'r') as f:
+        return yaml.safe_load(f)
+
+def get_certification_pages():
+    """Extract certification pages from mkdocs.yml."""
+    config = load_mkdocs_config()
+    cert_pages = []
+
+    for section in config['nav']:
+        if not isinstance(section, dict):
+            continue
+        for section_name in CERT_SECTIONS:
+            if section.get(section_name):
+                cert_pages.extend(process_section(section[section_name]))
+
+    return cert_pages
+
+def process_section(section):
+    """Process a section of the navigation and extract pages."""
+    pages = []
+    for item in section:
+        if isinstance(item, dict):
+            for title, content in item.items():
+                if isinstance(content, list):
+                    for subitem in content:
+                        if isinstance(subitem, str):
+                            pages.append((title, subitem))
+                        elif isinstance(subitem, dict):
+                            pages.extend([(f"{title} - {k}", v) for k, v in subitem.items()])
+    return pages
+
+def normalize_source(path):
+    """Normalize a markdown source path to the form used as a manifest key."""
+    return PurePosixPath(os.path.normpath(path).replace(os.sep, '/')).as_posix()
+
+def pdf_name_for(source):
+    """Return the cert-namespaced PDF path, relative to site/pdf, for a source."""
+    return str(PurePosixPath(normalize_source(source)).with_suffix('.pdf'))
+
+def build_manifest(pages):
+    """Build the source -> PDF manifest for the given (title, path) pages.
+
+    Returns (manifest, titles, skipped). titles maps each manifest source to
+    its page title; skipped lists (title, source, reason) for pages that were
+    not assigned an output because their source is missing, was already
+    listed, or its PDF name collides with another source.
+    """
+    manifest = {}
+    titles = {}
+    owners = {}
+    skipped = []
+
+    for title, path in pages:
+        if not path.endswith('.md'):
+            continue
+        source = normalize_source(path)
+        if not os.path.exists(source):
+            skipped.append((title, source, "missing source"))
+            continue
+        if source in manifest:
+            skipped.append((title, source, "duplicate source"))
+            continue
+
+        pdf_name = pdf_name_for(source)
+        # Compare case-insensitively so outputs stay distinct on any filesystem
+        key = pdf_name.lower()
+        if key in owners:
+            skipped.append((title, source, f"collides with {owners[key]}"))
+            continue
+
+        owners[key] = source
+        manifest[source] = pdf_name
+        titles[source] = title
+
+    return manifest, titles, skipped
+
+def write_manifest(manifest, path=MANIFEST_PATH):
+    """Write the manifest to disk as JSON."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def load_manifest(path=MANIFEST_PATH):
+    """Load the manifest, building it from mkdocs.yml if it has not been written yet."""
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    manifest, _, _ = build_manifest(get_certification_pages())
+    return manifest
+
+def pdf_url_for(manifest, source):
+    """Return the download URL for a source, or None if it has no PDF."""
+    pdf_name = manifest.get(normalize_source(source))
+    if pdf_name is None:
+        return None
+    return PDF_URL_PREFIX + pdf_name